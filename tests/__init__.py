@@ -11,3 +11,7 @@ def setup_formatter(snake: str, line_length: int = None, black_config_file=None)
     smk = Snakefile(stream)
     LogConfig.init(logging.DEBUG)
     return Formatter(smk, line_length=line_length, black_config_file=black_config_file)
+
+
+def format_snakefile(content: str, line_length: int = None) -> str:
+    return setup_formatter(content, line_length=line_length).get_formatted()
@@ -3,7 +3,7 @@
 The tests implicitly assume that the input syntax is correct ie that no parsing-related
 errors arise, as tested in test_parser.py.
 """
-from io import StringIO
+import sys
 from unittest import mock
 
 import pytest
@@ -11,122 +11,204 @@ import pytest
 from snakefmt.parser.grammar import SingleParam, SnakeGlobal
 from snakefmt.parser.syntax import COMMENT_SPACING
 from snakefmt.types import TAB
-from tests import Formatter, Snakefile, setup_formatter
+from tests import Formatter, format_snakefile, setup_formatter
 
+# Indent levels used in the tests. {TAB * 0} is kept where it marks a line left at
+# column 0 inside an indented block, so the relative alignment stays visible.
+TAB2, TAB3, TAB4, TAB5, TAB6 = (sys.intern(TAB * i) for i in range(2, 7))
 
-def test_emptyInput_emptyOutput():
-    formatter = setup_formatter("")
-
-    actual = formatter.get_formatted()
-    expected = ""
 
-    assert actual == expected
+@pytest.fixture
+def patched_black(monkeypatch) -> mock.MagicMock:
+    """Replaces black formatting in the Formatter with a specced mock"""
+    black_mock = mock.MagicMock(spec=Formatter.run_black_format_str, return_value="")
+    monkeypatch.setattr(Formatter, "run_black_format_str", black_mock)
+    return black_mock
 
 
-class TestSimpleParamFormatting:
-    def test_simple_rule_one_input(self):
-        stream = StringIO("rule a:\n" f'{TAB * 1}input: "foo.txt"')
-        smk = Snakefile(stream)
-        formatter = Formatter(smk)
-
-        actual = formatter.get_formatted()
-        expected = "rule a:\n" f"{TAB * 1}input:\n" f'{TAB * 2}"foo.txt",\n'
-
-        assert actual == expected
+def test_emptyInput_emptyOutput():
+    actual = format_snakefile("")
 
-    def test_single_param_keyword_stays_on_same_line(self):
-        """
-        Keywords that expect a single parameter do not have newline + indent
-        """
-        formatter = setup_formatter("configfile: \n" f'{TAB * 1}"foo.yaml"')
+    expected = ""
 
-        actual = formatter.get_formatted()
-        expected = 'configfile: "foo.yaml"\n'
+    assert actual == expected
 
-        assert actual == expected
 
-    def test_shell_param_newline_indented(self):
-        formatter = setup_formatter(
+# Parameters are delimited with ','. When ',' is present in other contexts
+# (function calls, lambdas, brackets), it must be ignored.
+_LAMBDA_WITH_MULTIPLE_ARGS_AND_IFELSE = (
+    f"rule a:\n"
+    f"{TAB}input:\n"
+    f'{TAB2}"foo.txt",\n'
+    f"{TAB}resources:\n"
+    f"{TAB2}time_min=lambda wildcards, attempt: (\n"
+    f'{TAB3}60 * 23 if "cv" in wildcards.method else 60 * 10\n'
+    f"{TAB2})\n"
+    f"{TAB2}* attempt,\n"
+)
+_LAMBDA_WITH_KEYWORD_ARG = (
+    f"rule a:\n"
+    f"{TAB}input:\n"
+    f'{TAB2}"foo.txt",\n'
+    f"{TAB}resources:\n"
+    f"{TAB2}mem_mb=lambda wildcards, attempt, mem=1000: attempt * mem,\n"
+)
+# 'input:' must not be recognised as a keyword, and ',' inside brackets ignored,
+# ie the lambda needs to be parsed as a parameter.
+_LAMBDA_WITH_INPUT_KEYWORD_AND_NESTED_PARENTHESES = (
+    f"rule a:\n"
+    f"{TAB}input:\n"
+    f'{TAB2}"foo.txt",\n'
+    f"{TAB}params:\n"
+    f"{TAB2}"
+    'obs=lambda w, input: ["{}={}".format(s, f) for s, f in zip(get(w), input.obs)],\n'  # noqa: E501  due to readability of test
+    f"{TAB2}p2=2,\n"
+)
+# issue 109
+_ARG_AND_KWARG_UNPACKING = (
+    f"rule r:\n"
+    f"{TAB}input:\n"
+    f'{TAB2}*["a", "b", "c"],\n'
+    f"{TAB2}*myfunc(a=1),\n"
+    f'{TAB2}**{{"a": "b", "c": "d"}},\n'
+    f"{TAB2}**myfunc(a=1, b=2),\n"
+    f"{TAB2}**module.myfunc(a=1, b=2),\n"
+)
+
+PARAM_FORMATTING_CASES = [
+    pytest.param(
+        "rule a:\n" f'{TAB}input: "foo.txt"',
+        "rule a:\n" f"{TAB}input:\n" f'{TAB2}"foo.txt",\n',
+        id="simple_rule_one_input",
+    ),
+    # Keywords that expect a single parameter do not have newline + indent
+    pytest.param(
+        "configfile: \n" f'{TAB}"foo.yaml"',
+        'configfile: "foo.yaml"\n',
+        id="single_param_keyword_stays_on_same_line",
+    ),
+    pytest.param(
+        (
             "rule a:\n"
-            f'{TAB * 1}shell: "for i in $(seq 1 5);"\n'
-            f'{TAB * 2}"do echo $i;"\n'
-            f'{TAB * 2}"done"'
-        )
-        expected = (
+            f'{TAB}shell: "for i in $(seq 1 5);"\n'
+            f'{TAB2}"do echo $i;"\n'
+            f'{TAB2}"done"'
+        ),
+        (
             "rule a:\n"
-            f"{TAB * 1}shell:\n"
-            f'{TAB * 2}"for i in $(seq 1 5);"\n'
-            f'{TAB * 2}"do echo $i;"\n'
-            f'{TAB * 2}"done"\n'
-        )
-        assert formatter.get_formatted() == expected
-
-    def test_single_param_keyword_in_rule_gets_newline_indented(self):
-        formatter = setup_formatter(
+            f"{TAB}shell:\n"
+            f'{TAB2}"for i in $(seq 1 5);"\n'
+            f'{TAB2}"do echo $i;"\n'
+            f'{TAB2}"done"\n'
+        ),
+        id="shell_param_newline_indented",
+    ),
+    pytest.param(
+        (
             f"rule a: \n"
-            f'{TAB * 1}input: "a", "b",\n'
-            f'{TAB * 4}"c"\n'
-            f'{TAB * 1}wrapper: "mywrapper"'
-        )
-
-        actual = formatter.get_formatted()
-        expected = (
+            f'{TAB}input: "a", "b",\n'
+            f'{TAB4}"c"\n'
+            f'{TAB}wrapper: "mywrapper"'
+        ),
+        (
             "rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"a",\n'
-            f'{TAB * 2}"b",\n'
-            f'{TAB * 2}"c",\n'
-            f"{TAB * 1}wrapper:\n"
-            f'{TAB * 2}"mywrapper"\n'
-        )
-
-        assert actual == expected
-
-    def test_single_numeric_param_keyword_in_rule_stays_on_same_line(self):
-        formatter = setup_formatter(
+            f"{TAB}input:\n"
+            f'{TAB2}"a",\n'
+            f'{TAB2}"b",\n'
+            f'{TAB2}"c",\n'
+            f"{TAB}wrapper:\n"
+            f'{TAB2}"mywrapper"\n'
+        ),
+        id="single_param_keyword_in_rule_gets_newline_indented",
+    ),
+    pytest.param(
+        (
             "rule a: \n"
-            f'{TAB * 1}input: "c"\n'
-            f"{TAB * 1}threads:\n"
-            f"{TAB * 2}20\n"
-            f"{TAB * 1}default_target:\n"
-            f"{TAB * 2}True\n"
-        )
-
-        actual = formatter.get_formatted()
-        expected = (
-            f'rule a:\n{TAB * 1}input:\n{TAB * 2}"c",\n{TAB * 1}threads: 20\n'
-            f"{TAB * 1}default_target: True\n"
-        )
-
-        assert actual == expected
+            f'{TAB}input: "c"\n'
+            f"{TAB}threads:\n"
+            f"{TAB2}20\n"
+            f"{TAB}default_target:\n"
+            f"{TAB2}True\n"
+        ),
+        (
+            f'rule a:\n{TAB}input:\n{TAB2}"c",\n{TAB}threads: 20\n'
+            f"{TAB}default_target: True\n"
+        ),
+        id="single_numeric_param_keyword_in_rule_stays_on_same_line",
+    ),
+    pytest.param(
+        (
+            "rule a:\n"
+            f"{TAB}input: \n"
+            f"{TAB2}"
+            'expand("{f}/{p}", f = [1, 2], p = ["1", "2"])\n'
+            f'{TAB}output:"foo.txt","bar.txt"\n'
+        ),
+        (
+            "rule a:\n"
+            f"{TAB}input:\n"
+            f"{TAB2}"
+            'expand("{f}/{p}", f=[1, 2], p=["1", "2"]),\n'
+            f"{TAB}output:\n"
+            f'{TAB2}"foo.txt",\n'
+            f'{TAB2}"bar.txt",\n'
+        ),
+        id="expand_as_param",
+    ),
+    pytest.param(
+        _LAMBDA_WITH_MULTIPLE_ARGS_AND_IFELSE,
+        _LAMBDA_WITH_MULTIPLE_ARGS_AND_IFELSE,
+        id="lambda_function_with_multiple_args_and_ifelse",
+    ),
+    pytest.param(
+        _LAMBDA_WITH_KEYWORD_ARG,
+        _LAMBDA_WITH_KEYWORD_ARG,
+        id="lambda_function_with_keyword_arg",
+    ),
+    pytest.param(
+        _LAMBDA_WITH_INPUT_KEYWORD_AND_NESTED_PARENTHESES,
+        _LAMBDA_WITH_INPUT_KEYWORD_AND_NESTED_PARENTHESES,
+        id="lambda_function_with_input_keyword_and_nested_parentheses",
+    ),
+    pytest.param(
+        _ARG_AND_KWARG_UNPACKING,
+        _ARG_AND_KWARG_UNPACKING,
+        id="arg_and_kwarg_unpacking",
+    ),
+]
+
+
+@pytest.mark.parametrize("snakecode,expected", PARAM_FORMATTING_CASES)
+def test_param_formatting(snakecode, expected):
+    assert format_snakefile(snakecode) == expected
 
 
 class TestModuleFormatting:
     def test_module_specific_keyword_formatting(self):
-        formatter = setup_formatter(
+        actual = format_snakefile(
             "module a: \n"
-            f'{TAB * 1}snakefile: "other.smk"\n'
-            f"{TAB * 1}config: config\n"
-            f'{TAB * 1}prefix: "testmodule"\n'
-            f'{TAB * 1}replace_prefix: {{"results/": "results/testmodule/"}}\n'
-            f'{TAB * 1}meta_wrapper: "0.72.0/meta/bio/bwa_mapping"\n'
+            f'{TAB}snakefile: "other.smk"\n'
+            f"{TAB}config: config\n"
+            f'{TAB}prefix: "testmodule"\n'
+            f'{TAB}replace_prefix: {{"results/": "results/testmodule/"}}\n'
+            f'{TAB}meta_wrapper: "0.72.0/meta/bio/bwa_mapping"\n'
         )
 
         expected = (
             "module a:\n"
-            f"{TAB * 1}snakefile:\n"
-            f'{TAB * 2}"other.smk"\n'
-            f"{TAB * 1}config:\n"
-            f"{TAB * 2}config\n"
-            f"{TAB * 1}prefix:\n"
-            f'{TAB * 2}"testmodule"\n'
-            f"{TAB * 1}replace_prefix:\n"
-            f'{TAB * 2}{{"results/": "results/testmodule/"}}\n'
-            f"{TAB * 1}meta_wrapper:\n"
-            f'{TAB * 2}"0.72.0/meta/bio/bwa_mapping"\n'
+            f"{TAB}snakefile:\n"
+            f'{TAB2}"other.smk"\n'
+            f"{TAB}config:\n"
+            f"{TAB2}config\n"
+            f"{TAB}prefix:\n"
+            f'{TAB2}"testmodule"\n'
+            f"{TAB}replace_prefix:\n"
+            f'{TAB2}{{"results/": "results/testmodule/"}}\n'
+            f"{TAB}meta_wrapper:\n"
+            f'{TAB2}"0.72.0/meta/bio/bwa_mapping"\n'
         )
 
-        assert formatter.get_formatted() == expected
+        assert actual == expected
 
 
 class TestUseRuleFormatting:
@@ -134,11 +216,10 @@ class TestUseRuleFormatting:
         snakecode = (
             'include: "file.txt"\n\n\n'
             "use rule a from module with:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}b=2,\n"
+            f"{TAB}input:\n"
+            f"{TAB2}b=2,\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_use_rule_with_exclude(self):
         snakecode = """from snakemake.utils import min_version
@@ -155,8 +236,7 @@ module other_workflow:
 
 use rule * from other_workflow exclude ruleC as other_*
 """
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_use_rule_with_multiple_excludes(self):
         snakecode = """from snakemake.utils import min_version
@@ -173,181 +253,70 @@ module other_workflow:
 
 use rule * from other_workflow exclude ruleC, foo as other_*
 """
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_use_rule_no_with_two_line_indented(self):
         snakecode = 'include: "file.txt"\n\n\n' "use rule * from module as module_*\n"
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_use_rule_with_comment(self):
         snakecode = (
             "# Comment here\n\n\n"
             "use rule * from module as module_*  # Use these cool rules\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_use_rule_newline_spacing(self):
         snakecode = (
             "use rule * from module as module_*\n\n\n"
             "rule baz:\n"
-            f"{TAB * 1}threads: 4\n"
+            f"{TAB}threads: 4\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
-
-
-class TestComplexParamFormatting:
-    """
-    Parameters are delimited with ','
-    When ',' is present in other contexts, must be ignored
-    """
+        assert format_snakefile(snakecode) == snakecode
 
-    def test_expand_as_param(self):
-        stream = StringIO(
-            "rule a:\n"
-            f"{TAB * 1}input: \n"
-            f"{TAB * 2}"
-            'expand("{f}/{p}", f = [1, 2], p = ["1", "2"])\n'
-            f'{TAB * 1}output:"foo.txt","bar.txt"\n'
-        )
 
-        smk = Snakefile(stream)
-        formatter = Formatter(smk)
-        actual = formatter.get_formatted()
-
-        expected = (
-            "rule a:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}"
-            'expand("{f}/{p}", f=[1, 2], p=["1", "2"]),\n'
-            f"{TAB * 1}output:\n"
-            f'{TAB * 2}"foo.txt",\n'
-            f'{TAB * 2}"bar.txt",\n'
-        )
-
-        assert actual == expected
-
-    def test_lambda_function_with_multiple_args_and_ifelse(self):
-        snakecode = (
-            f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"foo.txt",\n'
-            f"{TAB * 1}resources:\n"
-            f"{TAB * 2}time_min=lambda wildcards, attempt: (\n"
-            f'{TAB * 3}60 * 23 if "cv" in wildcards.method else 60 * 10\n'
-            f"{TAB * 2})\n"
-            f"{TAB * 2}* attempt,\n"
-        )
-        formatter = setup_formatter(snakecode)
-        actual = formatter.get_formatted()
-        assert actual == snakecode
-
-    def test_lambda_function_with_keyword_arg(self):
-        snakecode = (
-            f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"foo.txt",\n'
-            f"{TAB * 1}resources:\n"
-            f"{TAB * 2}mem_mb=lambda wildcards, attempt, mem=1000: attempt * mem,\n"
-        )
-        formatter = setup_formatter(snakecode)
-        actual = formatter.get_formatted()
-        assert actual == snakecode
-
-    def test_lambda_function_with_input_keyword_and_nested_parentheses(self):
-        """
-        We need to ignore 'input:' as a recognised keyword and ',' inside brackets
-        Ie, the lambda needs to be parsed as a parameter.
-        """
-        snakefile = (
-            f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"foo.txt",\n'
-            f"{TAB * 1}params:\n"
-            f"{TAB * 2}"
-            'obs=lambda w, input: ["{}={}".format(s, f) for s, f in zip(get(w), input.obs)],\n'  # noqa: E501  due to readability of test
-            f"{TAB * 2}p2=2,\n"
-        )
-        formatter = setup_formatter(snakefile)
-
-        actual = formatter.get_formatted()
-        expected = snakefile
-        assert actual == expected
-
-    def test_arg_and_kwarg_unpacking(self):
-        """issue 109"""
-        snakecode = (
-            f"rule r:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}*["a", "b", "c"],\n'
-            f"{TAB * 2}*myfunc(a=1),\n"
-            f'{TAB * 2}**{{"a": "b", "c": "d"}},\n'
-            f"{TAB * 2}**myfunc(a=1, b=2),\n"
-            f"{TAB * 2}**module.myfunc(a=1, b=2),\n"
-        )
-        formatter = setup_formatter(snakecode)
-        actual = formatter.get_formatted()
-        assert actual == snakecode
+_MULTI_INDENT_PYTHON_CODE = "if p:\n" f"{TAB}for elem in p:\n" f"{TAB2}dothing(elem)\n"
 
 
 class TestSimplePythonFormatting:
-    @mock.patch(
-        "snakefmt.formatter.Formatter.run_black_format_str", spec=True, return_value=""
-    )
-    def test_commented_snakemake_syntax_formatted_as_python_code(self, mock_method):
+    def test_commented_snakemake_syntax_formatted_as_python_code(self, patched_black):
         """
         Tests this line triggers call to black formatting
         """
-        formatter = setup_formatter("#configfile: 'foo.yaml'")
-
-        formatter.get_formatted()
-        mock_method.assert_called_once()
-
-    def test_python_code_with_multi_indent_passes(self):
-        python_code = "if p:\n" f"{TAB * 1}for elem in p:\n" f"{TAB * 2}dothing(elem)\n"
-        # test black gets called
-        with mock.patch(
-            "snakefmt.formatter.Formatter.run_black_format_str",
-            spec=True,
-            return_value="",
-        ) as mock_m:
-            setup_formatter(python_code)
-            mock_m.assert_called_once()
-
-        # test black formatting output (here, is identical)
-        formatter = setup_formatter(python_code)
-        actual = formatter.get_formatted()
-        assert actual == python_code
+        setup_formatter("#configfile: 'foo.yaml'")
+        patched_black.assert_called_once()
+
+    def test_python_code_with_multi_indent_passes(self, patched_black):
+        setup_formatter(_MULTI_INDENT_PYTHON_CODE)
+        patched_black.assert_called_once()
+
+    def test_python_code_with_multi_indent_formatted_unchanged(self):
+        actual = format_snakefile(_MULTI_INDENT_PYTHON_CODE)
+        assert actual == _MULTI_INDENT_PYTHON_CODE
 
     def test_python_code_with_rawString(self):
         python_code = (
             "def get_read_group(wildcards):\n"
-            f'{TAB * 1}myvar = r"bytes"\n'
-            f'{TAB * 1}return r"\t@RID"\n'
+            f'{TAB}myvar = r"bytes"\n'
+            f'{TAB}return r"\t@RID"\n'
         )
-        formatter = setup_formatter(python_code)
-        assert formatter.get_formatted() == python_code
+        assert format_snakefile(python_code) == python_code
 
     def test_python_code_inside_run_keyword(self):
         snake_code = (
             "rule a:\n"
-            f"{TAB * 1}run:\n"
-            f"{TAB * 2}def s(a):\n"
-            f"{TAB * 3}if a:\n"
-            f'{TAB * 4}return "Hello World"\n'
+            f"{TAB}run:\n"
+            f"{TAB2}def s(a):\n"
+            f"{TAB3}if a:\n"
+            f'{TAB4}return "Hello World"\n'
         )
-        formatter = setup_formatter(snake_code)
-        assert formatter.get_formatted() == snake_code
+        assert format_snakefile(snake_code) == snake_code
 
     def test_line_wrapped_python_code_outside_rule(self):
         content = "list_of_lots_of_things = [1, 2, 3, 4, 5, 6]\n" "include: snakefile"
         line_length = 30
-        formatter = setup_formatter(content, line_length=line_length)
+        actual = format_snakefile(content, line_length=line_length)
 
-        actual = formatter.get_formatted()
         expected = (
             "list_of_lots_of_things = [\n"
             f"{TAB}1,\n{TAB}2,\n{TAB}3,\n{TAB}4,\n{TAB}5,\n{TAB}6,\n"
@@ -361,18 +330,17 @@ class TestSimplePythonFormatting:
         content = (
             f"rule a:\n"
             f"{TAB}input:\n"
-            f"{TAB*2}list_of_lots_of_things = [1, 2, 3, 4, 5]"
+            f"{TAB2}list_of_lots_of_things = [1, 2, 3, 4, 5]"
         )
         line_length = 30
-        formatter = setup_formatter(content, line_length=line_length)
+        actual = format_snakefile(content, line_length=line_length)
 
-        actual = formatter.get_formatted()
         expected = (
             "rule a:\n"
-            f"{TAB*1}input:\n"
-            f"{TAB*2}list_of_lots_of_things=[\n"
-            f"{TAB*3}1,\n{TAB*3}2,\n{TAB*3}3,\n{TAB*3}4,\n{TAB*3}5,\n"
-            f"{TAB*2}],\n"
+            f"{TAB}input:\n"
+            f"{TAB2}list_of_lots_of_things=[\n"
+            f"{TAB3}1,\n{TAB3}2,\n{TAB3}3,\n{TAB3}4,\n{TAB3}5,\n"
+            f"{TAB2}],\n"
         )
 
         assert actual == expected
@@ -382,18 +350,21 @@ class TestSimplePythonFormatting:
         snakecode = (
             "# comment\n"
             "rule foo:\n"
-            f"{TAB * 1}run:\n"
-            f'{TAB * 2}print("")\n\n\n'
+            f"{TAB}run:\n"
+            f'{TAB2}print("")\n\n\n'
             "@contextlib.contextmanager\n"
             "def f(wildcards):\n"
-            f"{TAB * 1}pass\n"
+            f"{TAB}pass\n"
         )
-        formatter = setup_formatter(snakecode)
+        actual = format_snakefile(snakecode)
 
-        actual = formatter.get_formatted()
         assert actual == snakecode
 
 
+_PYTHON_CODE_AFTER_NESTED_SNAKECODE = "if condition:\n" f'{TAB}include: "a"\n' "b=2\n"
+_PYTHON_CODE_BEFORE_NESTED_SNAKECODE = "b=2\n" "if condition:\n" f'{TAB}include: "a"\n'
+
+
 class TestComplexPythonFormatting:
     """
     Snakemake syntax can be nested inside python code
@@ -406,245 +377,252 @@ class TestComplexPythonFormatting:
         """https://github.com/snakemake/snakefmt/issues/159"""
         snakecode = (
             "if True:\n\n"
-            f"{TAB * 1}ruleorder: a > b\n"
-            f"{TAB * 1}# comment\n"
-            f"{TAB * 1}# comment\n"
-            f"{TAB * 1}ruleorder: c > d\n"
+            f"{TAB}ruleorder: a > b\n"
+            f"{TAB}# comment\n"
+            f"{TAB}# comment\n"
+            f"{TAB}ruleorder: c > d\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_snakemake_code_inside_python_code(self):
-        formatter = setup_formatter(
+        actual = format_snakefile(
             "if condition:\n"
-            f"{TAB * 1}rule a:\n"
-            f'{TAB * 2}input: "a", "b"\n'
+            f"{TAB}rule a:\n"
+            f'{TAB2}input: "a", "b"\n'
             "else:\n"
-            f"{TAB * 1}rule b:\n"
-            f'{TAB * 2}script: "c.py"'
+            f"{TAB}rule b:\n"
+            f'{TAB2}script: "c.py"'
         )
         expected = (
             "if condition:\n\n"
-            f"{TAB * 1}rule a:\n"
-            f"{TAB * 2}input:\n"
-            f'{TAB * 3}"a",\n'
-            f'{TAB * 3}"b",\n\n'
+            f"{TAB}rule a:\n"
+            f"{TAB2}input:\n"
+            f'{TAB3}"a",\n'
+            f'{TAB3}"b",\n\n'
             "else:\n\n"
-            f"{TAB * 1}rule b:\n"
-            f"{TAB * 2}script:\n"
-            f'{TAB * 3}"c.py"\n'
+            f"{TAB}rule b:\n"
+            f"{TAB2}script:\n"
+            f'{TAB3}"c.py"\n'
+        )
+        assert actual == expected
+
+    def test_python_code_after_nested_snakecode_gets_formatted(self, patched_black):
+        patched_black.return_value = "if condition:\n"
+        setup_formatter(_PYTHON_CODE_AFTER_NESTED_SNAKECODE)
+        assert patched_black.call_count == 3
+        assert patched_black.call_args_list[1] == mock.call(
+            '"a"', 0, 0, no_nesting=True
         )
-        assert formatter.get_formatted() == expected
-
-    def test_python_code_after_nested_snakecode_gets_formatted(self):
-        snakecode = "if condition:\n" f'{TAB * 1}include: "a"\n' "b=2\n"
-        with mock.patch(
-            "snakefmt.formatter.Formatter.run_black_format_str", spec=True
-        ) as mock_m:
-            mock_m.return_value = "if condition:\n"
-            setup_formatter(snakecode)
-            assert mock_m.call_count == 3
-            assert mock_m.call_args_list[1] == mock.call('"a"', 0, 0, no_nesting=True)
-            assert mock_m.call_args_list[2] == mock.call("b = 2\n", 0)
-
-        formatter = setup_formatter(snakecode)
+        assert patched_black.call_args_list[2] == mock.call("b = 2\n", 0)
+
+    def test_python_code_after_nested_snakecode_formatted_output(self):
         expected = (
             "if condition:\n\n"
-            f'{TAB * 1}include: "a"\n'
+            f'{TAB}include: "a"\n'
             "\n\nb = 2\n"  # python code gets formatted here
         )
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(_PYTHON_CODE_AFTER_NESTED_SNAKECODE) == expected
 
-    def test_python_code_before_nested_snakecode_gets_formatted(self):
-        snakecode = "b=2\n" "if condition:\n" f'{TAB * 1}include: "a"\n'
-        with mock.patch(
-            "snakefmt.formatter.Formatter.run_black_format_str", spec=True
-        ) as mock_m:
-            mock_m.return_value = "b=2\nif condition:\n"
-            setup_formatter(snakecode)
-            assert mock_m.call_count == 2
+    def test_python_code_before_nested_snakecode_gets_formatted(self, patched_black):
+        patched_black.return_value = "b=2\nif condition:\n"
+        setup_formatter(_PYTHON_CODE_BEFORE_NESTED_SNAKECODE)
+        assert patched_black.call_count == 2
 
-        formatter = setup_formatter(snakecode)
-        expected = "b = 2\n" "if condition:\n\n" f'{TAB * 1}include: "a"\n'
-        assert formatter.get_formatted() == expected
+    def test_python_code_before_nested_snakecode_formatted_output(self):
+        expected = "b = 2\n" "if condition:\n\n" f'{TAB}include: "a"\n'
+        assert format_snakefile(_PYTHON_CODE_BEFORE_NESTED_SNAKECODE) == expected
 
     def test_pythoncode_parser_based_formatting_before_snakecode(self):
         snakecode = (
             'if c["a"]is None:\n\n'  # space needed before '['
-            f'{TAB * 1}include: "a"\n\n\n'
+            f'{TAB}include: "a"\n\n\n'
             'elif myobj.attr == "b":\n\n'
-            f'{TAB * 1}include: "b"\n\n\n'
+            f'{TAB}include: "b"\n\n\n'
             'elif len(c["c"])==3:\n\n'  # spaces needed either side of '=='
-            f'{TAB * 1}include: "c"\n'
+            f'{TAB}include: "c"\n'
         )
 
-        formatter = setup_formatter(snakecode)
         expected = (
             'if c["a"] is None:\n\n'
-            f'{TAB * 1}include: "a"\n\n'
+            f'{TAB}include: "a"\n\n'
             'elif myobj.attr == "b":\n\n'
-            f'{TAB * 1}include: "b"\n\n'
+            f'{TAB}include: "b"\n\n'
             'elif len(c["c"]) == 3:\n\n'
-            f'{TAB * 1}include: "c"\n'
+            f'{TAB}include: "c"\n'
         )
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_nested_snakecode_python_else_does_not_fail(self):
         snakecode = (
             'if c["a"] is None:\n\n'
-            f"{TAB * 1}rule a:\n"
-            f'{TAB * 2}shell:""\n\n\n'
+            f"{TAB}rule a:\n"
+            f'{TAB2}shell:""\n\n\n'
             "else:\n"  # All python from here
-            f'{TAB * 1}var = "b"\n'
+            f'{TAB}var = "b"\n'
         )
         expected = (
             'if c["a"] is None:\n\n'
-            f"{TAB * 1}rule a:\n"
-            f"{TAB * 2}shell:\n"
-            f'{TAB * 3}""\n\n'
+            f"{TAB}rule a:\n"
+            f"{TAB2}shell:\n"
+            f'{TAB3}""\n\n'
             "else:\n"  # All python from here
-            f'{TAB * 1}var = "b"\n'
+            f'{TAB}var = "b"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_multiple_rules_inside_python_code(self):
-        formatter = setup_formatter(
+        actual = format_snakefile(
             "if condition:\n"
-            f"{TAB * 1}rule a:\n"
-            f'{TAB * 2}wrapper: "a"\n'
-            f"{TAB * 1}rule b:\n"
-            f'{TAB * 2}script: "b"'
+            f"{TAB}rule a:\n"
+            f'{TAB2}wrapper: "a"\n'
+            f"{TAB}rule b:\n"
+            f'{TAB2}script: "b"'
         )
         expected = (
             "if condition:\n\n"
-            f"{TAB * 1}rule a:\n"
-            f"{TAB * 2}wrapper:\n"
-            f'{TAB * 3}"a"\n\n'
-            f"{TAB * 1}rule b:\n"
-            f"{TAB * 2}script:\n"
-            f'{TAB * 3}"b"\n'
+            f"{TAB}rule a:\n"
+            f"{TAB2}wrapper:\n"
+            f'{TAB3}"a"\n\n'
+            f"{TAB}rule b:\n"
+            f"{TAB2}script:\n"
+            f'{TAB3}"b"\n'
         )
-        assert formatter.get_formatted() == expected
+        assert actual == expected
 
     def test_indented_consecutive_snakemake_directives(self):
         snakecode = (
             'if config["load"]:\n\n'
-            f'{TAB * 1}include: "module_a.smk"\n'
-            f'{TAB * 1}include: "module_b.smk"\n'
+            f'{TAB}include: "module_a.smk"\n'
+            f'{TAB}include: "module_b.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_spaced_out_consecutive_dedented_directive_dedented_stays_collated(self):
         """https://github.com/snakemake/snakefmt/pull/172"""
         snakecode = (
             'if config["load"]:\n\n'
-            f'{TAB * 1}include: "module_a.smk"\n\n'
+            f'{TAB}include: "module_a.smk"\n\n'
             f"else:\n\n"
-            f'{TAB * 1}include: "module_b.smk"\n\n\n'
+            f'{TAB}include: "module_b.smk"\n\n\n'
             'include: "other.smk"\n'
             'include: "other2.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comment_support_after_python_code(self):
         snakecode = (
             'if config["a"]:\n\n'
-            f'{TAB * 1}include: "module_a.smk"\n\n\n'
+            f'{TAB}include: "module_a.smk"\n\n\n'
             f'# include: "module_b.smk"\n\n\n'
             f'if config["c"]:\n\n'
-            f'{TAB * 1}include: "module_c.smk"\n'
+            f'{TAB}include: "module_c.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_if_statements_with_comments_and_snakecode_inside(self):
         """https://github.com/snakemake/snakefmt/issues/126"""
         snakecode = (
             "# first standalone comment\n"
             "if True:\n"
-            f"{TAB * 1}if True:\n\n"
-            f"{TAB * 2}ruleorder: __a_ruleorder_and__  # inline comment\n"
+            f"{TAB}if True:\n\n"
+            f"{TAB2}ruleorder: __a_ruleorder_and__  # inline comment\n"
             "\n"
-            f"{TAB * 1}# second standalone comment\n"
-            f'{TAB * 1}var = "anything really"\n\n'
+            f"{TAB}# second standalone comment\n"
+            f'{TAB}var = "anything really"\n\n'
             f"else:\n\n"
-            f"{TAB * 1}# third standalone comment\n"
-            f"{TAB * 1}ruleorder: some_other_order\n"
+            f"{TAB}# third standalone comment\n"
+            f"{TAB}ruleorder: some_other_order\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_if_statements_with_comments_and_snakecode_inside2(self):
         """https://github.com/snakemake/snakefmt/pull/136#issuecomment-1125130038"""
         snakecode = (
             "if True:\n\n"
-            f"{TAB * 1}ruleorder: A > B\n"
+            f"{TAB}ruleorder: A > B\n"
             "\n"
-            f"{TAB * 1}mylist = []  # inline comment\n"
-            f'{TAB * 1}mystr = "a"  # inline comment\n'
+            f"{TAB}mylist = []  # inline comment\n"
+            f'{TAB}mystr = "a"  # inline comment\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_if_statements_with_comments_and_snakecode_inside3(self):
         """https://github.com/snakemake/snakefmt/pull/136#issuecomment-1132845522"""
         snakecode = (
             "if True:\n\n"
-            f"{TAB * 1}rule with_run_directive:\n"
-            f"{TAB * 2}output:\n"
-            f'{TAB * 3}"test.txt",\n'
-            f"{TAB * 2}run:\n"
-            f"{TAB * 3}if True:\n"
-            f'{TAB * 4}print("this line is in the error")\n'
+            f"{TAB}rule with_run_directive:\n"
+            f"{TAB2}output:\n"
+            f'{TAB3}"test.txt",\n'
+            f"{TAB2}run:\n"
+            f"{TAB3}if True:\n"
+            f'{TAB4}print("this line is in the error")\n'
             "\n"
-            f'{TAB * 1}print("the indenting on this line matters")\n'
+            f'{TAB}print("the indenting on this line matters")\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_if_statements_with_function_and_snakecode_inside(self):
         """https://github.com/snakemake/snakefmt/pull/136#issuecomment-1125130038"""
         snakecode = (
             "if True:\n\n"
-            f"{TAB * 1}ruleorder: A > B\n\n"
-            f"{TAB * 1}def myfunc():\n"
-            f"{TAB * 2}pass\n"
+            f"{TAB}ruleorder: A > B\n\n"
+            f"{TAB}def myfunc():\n"
+            f"{TAB2}pass\n"
             "\n"
-            f"{TAB * 1}mylist = []\n"
+            f"{TAB}mylist = []\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_ifelse_statements(self):
         snakecode = (
             'if config["a"] is None:\n\n'
-            f'{TAB * 1}include: "module_a_none.smk"\n\n'
+            f'{TAB}include: "module_a_none.smk"\n\n'
             f"else:\n"
-            f'{TAB * 1}if config["b"] is None:\n\n'
-            f'{TAB * 2}include: "module_b.smk"\n\n'
-            f"{TAB * 1}else:\n\n"
-            f'{TAB * 2}include: "module_c.smk"\n'
+            f'{TAB}if config["b"] is None:\n\n'
+            f'{TAB2}include: "module_b.smk"\n\n'
+            f"{TAB}else:\n\n"
+            f'{TAB2}include: "module_c.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_nested_ifelse_statements_multiple_python_lines(self):
         snakecode = (
             'if config["a"] is None:\n'
-            f"{TAB * 1}a = 1\n\n"
-            f'{TAB * 1}include: "module_a_none.smk"\n\n'
+            f"{TAB}a = 1\n\n"
+            f'{TAB}include: "module_a_none.smk"\n\n'
             f"else:\n"
-            f'{TAB * 1}if config["b"] is None:\n\n'
-            f'{TAB * 2}include: "module_b.smk"\n\n'
-            f"{TAB * 1}else:\n"
-            f"{TAB * 2}b = 0\n\n"
-            f'{TAB * 2}include: "module_c.smk"\n'
+            f'{TAB}if config["b"] is None:\n\n'
+            f'{TAB2}include: "module_b.smk"\n\n'
+            f"{TAB}else:\n"
+            f"{TAB2}b = 0\n\n"
+            f'{TAB2}include: "module_c.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
+
+
+# {TAB * 0} marks lines left at column 0 in the two expectations below
+_EXPECTED_TPQ_ALIGN = f'''
+rule a:
+{TAB}shell:
+{TAB2}"""Starts here
+{TAB * 0}  Hello
+{TAB}World
+{TAB2}  Tabbed
+{TAB}"""
+'''
+
+_EXPECTED_DOCSTRING_RETAB = f'''def f():
+{TAB}"""Does not do
+    much"""
+{TAB}pass
+
+
+rule a:
+{TAB}"""The rule a
+{TAB * 0}"""
+{TAB}message:
+{TAB2}"a"
+'''
 
 
 class TestStringFormatting:
@@ -653,29 +631,25 @@ class TestStringFormatting:
     def test_param_with_string_mixture_retabbed_and_string_normalised(self):
         snakecode = (
             "rule a:\n"
-            f"{TAB * 1}message:\n"
-            f'{TAB * 2}"""Hello"""\n'
-            f"{TAB * 2}'''    a string'''\n"
-            f'{TAB * 3}"World"\n'
-            f'{TAB * 3}"""    Yes"""\n'
+            f"{TAB}message:\n"
+            f'{TAB2}"""Hello"""\n'
+            f"{TAB2}'''    a string'''\n"
+            f'{TAB3}"World"\n'
+            f'{TAB3}"""    Yes"""\n'
         )
         expected = (
             "rule a:\n"
-            f"{TAB * 1}message:\n"
-            f'{TAB * 2}"""Hello"""\n'
-            f'{TAB * 2}"""    a string"""\n'  # Quotes normalised
-            f'{TAB * 2}"World"\n'
-            f'{TAB * 2}"""    Yes"""\n'
+            f"{TAB}message:\n"
+            f'{TAB2}"""Hello"""\n'
+            f'{TAB2}"""    a string"""\n'  # Quotes normalised
+            f'{TAB2}"World"\n'
+            f'{TAB2}"""    Yes"""\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_keyword_with_tpq_inside_expression_left_alone(self):
-        snakecode = (
-            "rule test:\n" f"{TAB * 1}run:\n" f'{TAB * 2}shell(f"""shell stuff""")\n'
-        )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        snakecode = "rule test:\n" f"{TAB}run:\n" f'{TAB2}shell(f"""shell stuff""")\n'
+        assert format_snakefile(snakecode) == snakecode
 
     def test_rf_string_tpq_supported(self):
         """Deliberately tests for consecutive r/f strings and with
@@ -683,17 +657,17 @@ class TestStringFormatting:
         for preceding in {"r", "f"}:
             snakecode = (
                 "rule top:\n"
-                f"{TAB * 1}shell:\n"
-                f'{TAB * 2}{preceding}"""\n'
-                f"{TAB * 2}Multi_line\n"
-                f'{TAB * 2}"""\n'
-                f'{TAB * 2}{preceding}"""\n'
-                f"{TAB * 2}Other multi_line\n"
-                f'{TAB * 2}"""\n'
+                f"{TAB}shell:\n"
+                f'{TAB2}{preceding}"""\n'
+                f"{TAB2}Multi_line\n"
+                f'{TAB2}"""\n'
+                f'{TAB2}{preceding}"""\n'
+                f"{TAB2}Other multi_line\n"
+                f'{TAB2}"""\n'
             )
-            assert setup_formatter(snakecode).get_formatted() == snakecode
+            assert format_snakefile(snakecode) == snakecode
             snakecode2 = snakecode.replace('"""', "'''")
-            assert setup_formatter(snakecode2).get_formatted() == snakecode
+            assert format_snakefile(snakecode2) == snakecode
 
     def test_tpq_alignment_and_keep_relative_indenting(self):
         snakecode = '''
@@ -705,18 +679,7 @@ rule a:
   \t\tTabbed
     """
 '''
-        formatter = setup_formatter(snakecode)
-
-        expected = f'''
-rule a:
-{TAB * 1}shell:
-{TAB * 2}"""Starts here
-{TAB * 0}  Hello
-{TAB * 1}World
-{TAB * 2}  Tabbed
-{TAB * 1}"""
-'''
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == _EXPECTED_TPQ_ALIGN
 
     def test_tpq_alignment_and_keep_relative_indenting_for_r_string(self):
         snakecode = '''rule one:
@@ -732,51 +695,50 @@ EOF
 bash tmp.txt
         """
 '''
-        formatter = setup_formatter(snakecode)
-
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_tpq_alignment_and_keep_relative_indenting_for_multiline_string(self):
         snakecode = (
             "rule a:\n"
-            f'{TAB * 1}shell: """\n'
-            f'{TAB * 2}python -c "\n'
+            f'{TAB}shell: """\n'
+            f'{TAB2}python -c "\n'
+            # {TAB * 0}: the python string content is not reindented
             f"{TAB * 0}if True:\n"
-            f"{TAB * 1}print('Hello, world!')\n"
-            f'{TAB * 2}"""'
+            f"{TAB}print('Hello, world!')\n"
+            f'{TAB2}"""'
         )
-        formatter = setup_formatter(snakecode)
+
         expected = (
             "rule a:\n"
-            f"{TAB * 1}shell:\n"
-            f'{TAB * 2}"""\n'
-            f'{TAB * 2}python -c "\n'
+            f"{TAB}shell:\n"
+            f'{TAB2}"""\n'
+            f'{TAB2}python -c "\n'
+            # {TAB * 0}: the python string content is not reindented
             f"{TAB * 0}if True:\n"
-            f"{TAB * 1}print('Hello, world!')\n"
-            f'{TAB * 2}"""\n'
+            f"{TAB}print('Hello, world!')\n"
+            f'{TAB2}"""\n'
         )
-
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_single_quoted_multiline_string_proper_tabbing(self):
         snakecode = f"""
 rule a:
-{TAB * 1}shell:
-{TAB * 2}"(kallisto quant \\
+{TAB}shell:
+{TAB2}"(kallisto quant \\
         --pseudobam \\
         input > output) \\
         2> log.stderr"
 """
-        formatter = setup_formatter(snakecode)
+
         expected = f"""
 rule a:
-{TAB * 1}shell:
-{TAB * 2}"(kallisto quant \\
-{TAB * 2}--pseudobam \\
-{TAB * 2}input > output) \\
-{TAB * 2}2> log.stderr"
+{TAB}shell:
+{TAB2}"(kallisto quant \\
+{TAB2}--pseudobam \\
+{TAB2}input > output) \\
+{TAB2}2> log.stderr"
 """
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_docstrings_get_retabbed_for_snakecode_only(self):
         """Black only retabs the first tpq in a docstring."""
@@ -793,20 +755,7 @@ rule a:
   message:
     "a"
 '''
-        formatter = setup_formatter(snakecode)
-        expected = f'''def f():
-{TAB * 1}"""Does not do
-    much"""
-{TAB * 1}pass
-
-
-rule a:
-{TAB * 1}"""The rule a
-{TAB * 0}"""
-{TAB * 1}message:
-{TAB * 2}"a"
-'''
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == _EXPECTED_DOCSTRING_RETAB
 
     def test_tpq_inside_run_block(self):
         snakecode = '''rule cutadapt:
@@ -833,9 +782,7 @@ rule a:
             """
             )
 '''
-        formatter = setup_formatter(snakecode)
-
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
 
 class TestReformatting_SMK_BREAK:
@@ -846,71 +793,61 @@ class TestReformatting_SMK_BREAK:
 
     def test_key_value_parameter_repositioning(self):
         """Key/val params can occur before positional params"""
-        formatter = setup_formatter(
-            f"rule a:\n" f"{TAB * 1}input:\n" f'{TAB * 2}a="b",\n' f'{TAB * 2}"c"\n'
-        )
-        expected = (
-            f"rule a:\n" f"{TAB * 1}input:\n" f'{TAB * 2}"c",\n' f'{TAB * 2}a="b",\n'
+        actual = format_snakefile(
+            f"rule a:\n" f"{TAB}input:\n" f'{TAB2}a="b",\n' f'{TAB2}"c"\n'
         )
-        assert formatter.get_formatted() == expected
+        expected = f"rule a:\n" f"{TAB}input:\n" f'{TAB2}"c",\n' f'{TAB2}a="b",\n'
+        assert actual == expected
 
 
 class TestCommentTreatment:
     def test_comment_after_parameter_keyword_twonewlines(self):
         snakecode = 'include: "a"\n# A comment\n'
-        formatter = setup_formatter(snakecode)
+
         expected = 'include: "a"\n\n\n# A comment\n'
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_comment_after_keyword_kept(self):
-        snakecode = "rule a:  # A comment \n" f"{TAB * 1}threads: 4\n"
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        snakecode = "rule a:  # A comment \n" f"{TAB}threads: 4\n"
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comments_after_parameters_kept(self):
         snakecode = (
             f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"myparam",  # a comment\n'
-            f'{TAB * 2}b="param2",  # another comment\n'
+            f"{TAB}input:\n"
+            f'{TAB2}"myparam",  # a comment\n'
+            f'{TAB2}b="param2",  # another comment\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comments_PEP8_spaced_and_aligned(self):
         snakecode = (
             f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"myparam",{COMMENT_SPACING * 2}# a comment\n'
-            f"{TAB * 2}    # another comment\n"
+            f"{TAB}input:\n"
+            f'{TAB2}"myparam",{COMMENT_SPACING * 2}# a comment\n'
+            f"{TAB2}    # another comment\n"
         )
         expected = (
             f"rule a:\n"
-            f"{TAB * 1}input:\n"
-            f'{TAB * 2}"myparam",{COMMENT_SPACING}# a comment\n'
-            f"{TAB * 2}# another comment\n"
+            f"{TAB}input:\n"
+            f'{TAB2}"myparam",{COMMENT_SPACING}# a comment\n'
+            f"{TAB2}# another comment\n"
         )
-
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_comment_outside_keyword_context_stays_untouched(self):
-        snakecode = (
-            f"rule a:\n" f"{TAB * 1}run:\n" f"{TAB * 2}f()\n\n\n" f"# A comment\n"
-        )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        snakecode = f"rule a:\n" f"{TAB}run:\n" f"{TAB2}f()\n\n\n" f"# A comment\n"
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comment_below_paramkeyword_stays_untouched(self):
         snakecode = (
             "rule all:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}# A list of inputs\n"
-            f"{TAB * 2}elem1,  #The first elem\n"
-            f"{TAB * 2}elem1,  #The second elem\n"
+            f"{TAB}input:\n"
+            f"{TAB2}# A list of inputs\n"
+            f"{TAB2}elem1,  #The first elem\n"
+            f"{TAB2}elem1,  #The second elem\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     @pytest.mark.xfail(
         reason="""This is non-trivial to implement, and black does no align the comments
@@ -919,125 +856,116 @@ class TestCommentTreatment:
     def test_aligned_comments_stay_untouched(self):
         snakecode = (
             "rule eval:                             # [hide]\n"
-            f"{TAB * 1}output:                      # [hide]\n"
-            f'{TAB * 2}directory("resources/eval"), # [hide]\n'
-            f"{TAB * 1}wrapper:                     # [hide]\n"
-            f'{TAB * 2}"master/bio/benchmark/eval"  # [hide]\n'
+            f"{TAB}output:                      # [hide]\n"
+            f'{TAB2}directory("resources/eval"), # [hide]\n'
+            f"{TAB}wrapper:                     # [hide]\n"
+            f'{TAB2}"master/bio/benchmark/eval"  # [hide]\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comments_above_parameter_keyword_stay_untouched(self):
         snakecode = (
             "rule all:\n"
-            f"{TAB * 1}params:\n"
-            f'{TAB * 2}extra="",  # optional\n'
-            f"{TAB * 1}# comment1 above resources\n"
-            f"{TAB * 1}# comment2 above resources\n"
-            f"{TAB * 1}resources:\n"
-            f"{TAB * 2}mem_mb=1024,\n"
+            f"{TAB}params:\n"
+            f'{TAB2}extra="",  # optional\n'
+            f"{TAB}# comment1 above resources\n"
+            f"{TAB}# comment2 above resources\n"
+            f"{TAB}resources:\n"
+            f"{TAB2}mem_mb=1024,\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_inline_formatted_params_relocate_inline_comments(self):
         snakecode = (
             "include: # Include\n"
-            f"{TAB * 1}file.txt\n\n\n"
+            f"{TAB}file.txt\n\n\n"
             "rule all:\n"
-            f"{TAB * 1}threads:  # Threads 1\n"
-            f"{TAB * 2}8  # Threads 2\n"
+            f"{TAB}threads:  # Threads 1\n"
+            f"{TAB2}8  # Threads 2\n"
         )
         expected = (
             "# Include\n"
             f"include: file.txt\n\n\n"
             "rule all:\n"
-            f"{TAB * 1}# Threads 1\n"
-            f"{TAB * 1}threads: 8  # Threads 2\n"
+            f"{TAB}# Threads 1\n"
+            f"{TAB}threads: 8  # Threads 2\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_preceding_comments_in_inline_formatted_params_get_relocated(self):
         snakecode = (
             "rule all:\n"
-            f"{TAB * 1}# Threads1\n"
-            f"{TAB * 1}threads: # Threads2\n"
-            f"{TAB * 2}# Threads3\n"
-            f"{TAB * 2}8  # Threads 4\n"
+            f"{TAB}# Threads1\n"
+            f"{TAB}threads: # Threads2\n"
+            f"{TAB2}# Threads3\n"
+            f"{TAB2}8  # Threads 4\n"
         )
         expected = (
             "rule all:\n"
-            f"{TAB * 1}# Threads1\n"
-            f"{TAB * 1}# Threads2\n"
-            f"{TAB * 1}# Threads3\n"
-            f"{TAB * 1}threads: 8  # Threads 4\n"
+            f"{TAB}# Threads1\n"
+            f"{TAB}# Threads2\n"
+            f"{TAB}# Threads3\n"
+            f"{TAB}threads: 8  # Threads 4\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_no_inline_comments_stay_untouched(self):
         snakecode = (
             "rule all:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}p=2,\n"
-            f"{TAB * 2}#comment1\n"
-            f"{TAB * 2}#comment2\n"
+            f"{TAB}input:\n"
+            f"{TAB2}p=2,\n"
+            f"{TAB2}#comment1\n"
+            f"{TAB2}#comment2\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_snakecode_after_indented_comment_does_not_get_unindented(self):
         """https://github.com/snakemake/snakefmt/issues/159#issue-1441174995"""
         snakecode = (
             'if config.get("s3_dst"):\n\n'
-            f'{TAB * 1}include: "workflow/rule1.smk"\n'
-            f'{TAB * 1}include: "workflow/rule2.smk"\n'
-            f"{TAB * 1}# a comment\n"
-            f"{TAB * 1}# further comment\n"
-            f'{TAB * 1}include: "workflow/rule3.smk"\n'
+            f'{TAB}include: "workflow/rule1.smk"\n'
+            f'{TAB}include: "workflow/rule2.smk"\n'
+            f"{TAB}# a comment\n"
+            f"{TAB}# further comment\n"
+            f'{TAB}include: "workflow/rule3.smk"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comments_after_params_maintain_indentation(self):
         """https://github.com/snakemake/snakefmt/issues/160"""
         snakecode = (
             "if True:\n\n"
-            f'{TAB * 1}include: "workflow.smk"\n'
+            f'{TAB}include: "workflow.smk"\n'
             "\n"
-            f"{TAB * 1}# indented comment\n"
+            f"{TAB}# indented comment\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comment_in_run_block_at_start(self):
         """https://github.com/snakemake/snakefmt/issues/169#issuecomment-1361067856"""
         snakecode = (
             "rule foo:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}[],\n"
-            f"{TAB * 1}run:\n"
-            f"{TAB * 2}# some comment\n"
-            f"{TAB * 2}y = 1\n"
-            f"{TAB * 2}if True:\n"
-            f"{TAB * 3}x = 3\n"
+            f"{TAB}input:\n"
+            f"{TAB2}[],\n"
+            f"{TAB}run:\n"
+            f"{TAB2}# some comment\n"
+            f"{TAB2}y = 1\n"
+            f"{TAB2}if True:\n"
+            f"{TAB3}x = 3\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_two_comments_in_rule_at_start(self):
         """https://github.com/snakemake/snakefmt/issues/169#issue-1505309440"""
         snakecode = (
             "if x:\n\n"
-            f"{TAB * 1}rule a:\n"
-            f"{TAB * 2}# test\n"
-            f"{TAB * 2}# test\n"
-            f"{TAB * 2}output:\n"
-            f'{TAB * 3}touch("data/a.txt"),\n'
+            f"{TAB}rule a:\n"
+            f"{TAB2}# test\n"
+            f"{TAB2}# test\n"
+            f"{TAB2}output:\n"
+            f'{TAB3}touch("data/a.txt"),\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_two_comments_in_global_context(self):
         """https://github.com/snakemake/snakefmt/issues/169#issuecomment-1365540999"""
@@ -1047,234 +975,213 @@ class TestCommentTreatment:
             "# BBB\n\n"
             'BATCH = "20220202"\n'
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_comment_documenting_onstart(self):
         """https://github.com/snakemake/snakefmt/issues/169#issuecomment-1404268174"""
         snakecode = (
             "onstart:\n"
-            f"{TAB * 1}# comment\n"
-            f"{TAB * 1}shell(\n"
-            f"{TAB * 2}f\"./bin/notify-on-start {{config.get('build_name', 'unknown')}} {{SLACK_TS_FILE}}\"\n"  # noqa: E501  due to readability of test
-            f"{TAB * 1})\n"
+            f"{TAB}# comment\n"
+            f"{TAB}shell(\n"
+            f"{TAB2}f\"./bin/notify-on-start {{config.get('build_name', 'unknown')}} {{SLACK_TS_FILE}}\"\n"  # noqa: E501  due to readability of test
+            f"{TAB})\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
-
-
-class TestNewlineSpacing:
-    def test_parameter_keyword_spacing_above(self):
-        formatter = setup_formatter("b = 2\n" 'configfile: "config.yaml"')
-
-        actual = formatter.get_formatted()
-        expected = 'b = 2\n\n\nconfigfile: "config.yaml"\n'
-
-        assert actual == expected
-
-    def test_parameter_keyword_spacing_below(self):
-        snakecode = 'configfile: "config.yaml"\nreport: "report.rst"\n'
-        formatter = setup_formatter(snakecode)
-        expected = 'configfile: "config.yaml"\n\n\nreport: "report.rst"\n'
+        assert format_snakefile(snakecode) == snakecode
 
-        assert formatter.get_formatted() == expected
 
-    def test_repeated_parameter_keyword_no_spacing(self):
-        """
-        For keywords that expect a single parameter in the global context,
-        (eg: 'configfile', 'include'), if they occur consecutively, do not
-        double-space them.
-        """
-        global_single_param_keywords = [
-            keyval[0]
-            for keyval in SnakeGlobal.spec.items()
-            if keyval[1].syntax is SingleParam
-        ]
-        snakecode = '{keyword_param}: "value1"\n{keyword_param}: "value2"\n'
-        for keyword in global_single_param_keywords:
-            replaced = snakecode.format(keyword_param=keyword)
-            formatter = setup_formatter(replaced)
-            assert formatter.get_formatted() == replaced
-
-    def test_repeated_parameter_keyword_comment_in_between_no_spacing(self):
-        snakecode = 'include: "a"\n# A comment\n # c2\ninclude: "b"\n'
-        expected = 'include: "a"\n# A comment\n# c2\ninclude: "b"\n'
-        assert setup_formatter(snakecode).get_formatted() == expected
-
-    def test_repeated_parameter_keyword_spaced_comment_in_between_spacing(self):
-        snakecode = 'include: "a"\n\n# A lone comment\n\ninclude: "b"\n'
-        expected = 'include: "a"\n\n\n# A lone comment\n\n\ninclude: "b"\n'
-        assert setup_formatter(snakecode).get_formatted() == expected
-
-    def test_repeated_parameter_keyword_code_in_between_spacing(self):
-        snakecode = 'include: "a"\n\n\nfoo = 2\n\n\ninclude: "b"\n'
-        assert setup_formatter(snakecode).get_formatted() == snakecode
-
-    def test_double_spacing_for_rules(self):
-        formatter = setup_formatter(
-            f"""above_rule = "2spaces"
-rule a:
-{TAB * 1}threads: 1
-
-
-
-rule b:
-{TAB * 1}threads: 2
-below_rule = "2spaces"
-"""
-        )
-
-        expected = f"""above_rule = "2spaces"
+_EXPECTED_DOUBLE_SPACED_RULES = f"""above_rule = "2spaces"
 
 
 rule a:
-{TAB * 1}threads: 1
+{TAB}threads: 1
 
 
 rule b:
-{TAB * 1}threads: 2
+{TAB}threads: 2
 
 
 below_rule = "2spaces"
 """
-        actual = formatter.get_formatted()
 
-        assert actual == expected
+_EXPECTED_MIXED_KEYWORD_SPACING = (
+    "def p():\n"
+    f"{TAB}pass\n\n\n"
+    f"include: a\n\n\n"
+    f"def p2():\n"
+    f"{TAB}pass\n\n\n"
+    f"def p3():\n"
+    f"{TAB}pass\n"
+)
+
+_REPEATED_KEYWORD_CODE_IN_BETWEEN = 'include: "a"\n\n\nfoo = 2\n\n\ninclude: "b"\n'
+_INITIAL_COMMENT = f"# load config\n" f"rule all:\n" f"{TAB}input:\n" f"{TAB2}files,\n"
+# https://github.com/snakemake/snakefmt/issues/149
+_PYTHON_SPACING_AFTER_KEYWORD = (
+    "if not config:\n\n"
+    f'{TAB}configfile: "config.yaml"\n\n\n'
+    'build_dir = "results"\n\n'
+    'auspice_dir = "auspice"\n'
+)
+# For keywords that expect a single parameter in the global context,
+# (eg: 'configfile', 'include'), if they occur consecutively, do not
+# double-space them.
+_GLOBAL_SINGLE_PARAM_KEYWORDS = [
+    keyword
+    for keyword, spec in SnakeGlobal.spec.items()
+    if issubclass(spec.syntax, SingleParam)
+]
+
+NEWLINE_CASES = [
+    pytest.param(
+        "b = 2\n" 'configfile: "config.yaml"',
+        'b = 2\n\n\nconfigfile: "config.yaml"\n',
+        id="parameter_keyword_spacing_above",
+    ),
+    pytest.param(
+        'configfile: "config.yaml"\nreport: "report.rst"\n',
+        'configfile: "config.yaml"\n\n\nreport: "report.rst"\n',
+        id="parameter_keyword_spacing_below",
+    ),
+    *[
+        pytest.param(
+            f'{keyword}: "value1"\n{keyword}: "value2"\n',
+            f'{keyword}: "value1"\n{keyword}: "value2"\n',
+            id=f"repeated_parameter_keyword_no_spacing-{keyword}",
+        )
+        for keyword in _GLOBAL_SINGLE_PARAM_KEYWORDS
+    ],
+    pytest.param(
+        'include: "a"\n# A comment\n # c2\ninclude: "b"\n',
+        'include: "a"\n# A comment\n# c2\ninclude: "b"\n',
+        id="repeated_parameter_keyword_comment_in_between_no_spacing",
+    ),
+    pytest.param(
+        'include: "a"\n\n# A lone comment\n\ninclude: "b"\n',
+        'include: "a"\n\n\n# A lone comment\n\n\ninclude: "b"\n',
+        id="repeated_parameter_keyword_spaced_comment_in_between_spacing",
+    ),
+    pytest.param(
+        _REPEATED_KEYWORD_CODE_IN_BETWEEN,
+        _REPEATED_KEYWORD_CODE_IN_BETWEEN,
+        id="repeated_parameter_keyword_code_in_between_spacing",
+    ),
+    pytest.param(
+        f"""above_rule = "2spaces"
+rule a:
+{TAB}threads: 1
 
-    def test_keyword_three_newlines_below_two_after_formatting(self):
-        formatter = setup_formatter('include: "a"\n\n\n\nconfigfile: "b"\n')
-        expected = 'include: "a"\n\n\nconfigfile: "b"\n'
 
-        assert formatter.get_formatted() == expected
 
-    def test_python_code_mixed_with_keywords_proper_spacing(self):
-        snakecode = (
+rule b:
+{TAB}threads: 2
+below_rule = "2spaces"
+""",
+        _EXPECTED_DOUBLE_SPACED_RULES,
+        id="double_spacing_for_rules",
+    ),
+    pytest.param(
+        'include: "a"\n\n\n\nconfigfile: "b"\n',
+        'include: "a"\n\n\nconfigfile: "b"\n',
+        id="keyword_three_newlines_below_two_after_formatting",
+    ),
+    pytest.param(
+        (
             "def p():\n"
-            f"{TAB * 1}pass\n"
+            f"{TAB}pass\n"
             f"include: a\n"
             f"def p2():\n"
-            f"{TAB * 1}pass\n"
-            f"def p3():\n"
-            f"{TAB * 1}pass\n"
-        )
-        formatter = setup_formatter(snakecode)
-
-        expected = (
-            "def p():\n"
-            f"{TAB * 1}pass\n\n\n"
-            f"include: a\n\n\n"
-            f"def p2():\n"
-            f"{TAB * 1}pass\n\n\n"
+            f"{TAB}pass\n"
             f"def p3():\n"
-            f"{TAB * 1}pass\n"
-        )
-
-        assert formatter.get_formatted() == expected
-
-    def test_initial_comment_does_not_trigger_spacing(self):
-        snakecode = (
-            f"# load config\n" f"rule all:\n" f"{TAB * 1}input:\n" f"{TAB * 2}files,\n"
-        )
-
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
-
-    def test_comment_sticks_to_rule(self):
-        snakecode = (
+            f"{TAB}pass\n"
+        ),
+        _EXPECTED_MIXED_KEYWORD_SPACING,
+        id="python_code_mixed_with_keywords_proper_spacing",
+    ),
+    pytest.param(
+        _INITIAL_COMMENT,
+        _INITIAL_COMMENT,
+        id="initial_comment_does_not_trigger_spacing",
+    ),
+    pytest.param(
+        ("def p():\n" f"{TAB}pass\n" f"#My rule a\n" f"rule a:\n" f"{TAB}threads: 1\n"),
+        (
             "def p():\n"
-            f"{TAB * 1}pass\n"
-            f"#My rule a\n"
-            f"rule a:\n"
-            f"{TAB * 1}threads: 1\n"
-        )
-        formatter = setup_formatter(snakecode)
-        expected = (
-            "def p():\n"
-            f"{TAB * 1}pass\n\n\n"
+            f"{TAB}pass\n\n\n"
             f"# My rule a\n"
             f"rule a:\n"
-            f"{TAB * 1}threads: 1\n"
-        )
-        assert formatter.get_formatted() == expected
-
-    def test_keyword_disjoint_comment_stays_keyword_disjoint(self):
-        snakecode = (
-            "def p():\n" f"{TAB * 1}pass\n" f"#A lone comment\n\n" f'include: "a"\n'
-        )
-        formatter = setup_formatter(snakecode)
-        expected = (
+            f"{TAB}threads: 1\n"
+        ),
+        id="comment_sticks_to_rule",
+    ),
+    pytest.param(
+        "def p():\n" f"{TAB}pass\n" f"#A lone comment\n\n" f'include: "a"\n',
+        (
             "def p():\n"
-            f"{TAB * 1}pass\n\n\n"  # Newlined by black
+            f"{TAB}pass\n\n\n"  # Newlined by black
             f"# A lone comment\n\n\n"  # Remains lone comment
             f'include: "a"\n'
-        )
-        assert formatter.get_formatted() == expected
-
-    def test_buffer_with_lone_comment(self):
-        snakecode = 'include: "a"\n# A comment\nreport: "b"\n'
-        expected = 'include: "a"\n\n\n# A comment\nreport: "b"\n'
-        assert setup_formatter(snakecode).get_formatted() == expected
-
-    def test_comment_inside_python_code_sticks_to_rule(self):
-        snakecode = f"if p:\n" f"{TAB * 1}# A comment\n" f'{TAB * 1}include: "a"\n'
-        expected = f"if p:\n\n" f"{TAB * 1}# A comment\n" f'{TAB * 1}include: "a"\n'
-        assert setup_formatter(snakecode).get_formatted() == expected
-
-    def test_comment_below_keyword_gets_spaced(self):
-        formatter = setup_formatter(
-            f"""# Rules
+        ),
+        id="keyword_disjoint_comment_stays_keyword_disjoint",
+    ),
+    pytest.param(
+        'include: "a"\n# A comment\nreport: "b"\n',
+        'include: "a"\n\n\n# A comment\nreport: "b"\n',
+        id="buffer_with_lone_comment",
+    ),
+    pytest.param(
+        f"if p:\n" f"{TAB}# A comment\n" f'{TAB}include: "a"\n',
+        f"if p:\n\n" f"{TAB}# A comment\n" f'{TAB}include: "a"\n',
+        id="comment_inside_python_code_sticks_to_rule",
+    ),
+    pytest.param(
+        f"""# Rules
 rule all:
-{TAB * 1}input: output_files
+{TAB}input: output_files
 # Comment
-"""
-        )
-
-        actual = formatter.get_formatted()
-        expected = f"""# Rules
+""",
+        f"""# Rules
 rule all:
-{TAB * 1}input:
-{TAB * 2}output_files,
+{TAB}input:
+{TAB2}output_files,
 
 
 # Comment
-"""
-        assert actual == expected
+""",
+        id="comment_below_keyword_gets_spaced",
+    ),
+    pytest.param(
+        _PYTHON_SPACING_AFTER_KEYWORD,
+        _PYTHON_SPACING_AFTER_KEYWORD,
+        id="spacing_in_python_code_after_keywrod_not_altered",
+    ),
+]
 
-    def test_spacing_in_python_code_after_keywrod_not_altered(self):
-        """https://github.com/snakemake/snakefmt/issues/149"""
-        snakecode = (
-            "if not config:\n\n"
-            f'{TAB * 1}configfile: "config.yaml"\n\n\n'
-            'build_dir = "results"\n\n'
-            'auspice_dir = "auspice"\n'
-        )
-
-        formatter = setup_formatter(snakecode)
 
-        assert formatter.get_formatted() == snakecode
+@pytest.mark.parametrize("snakecode,expected", NEWLINE_CASES)
+def test_newline_spacing(snakecode, expected):
+    assert format_snakefile(snakecode) == expected
 
 
 class TestLineWrapping:
     def test_long_line_within_rule_indentation_taken_into_account(self):
         snakecode = (
             f"rule coverage_report:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}lineage=expand(\n"
-            f'{TAB * 3}str(report_dir / "lineage_assignment" / "{{sample}}.lineage.csv"), sample=samples\n'  # noqa: E501  due to readability of test
-            f"{TAB * 2}),\n"
-            f"{TAB * 2}subsample_logs=list(subsample_logfiles),"
+            f"{TAB}input:\n"
+            f"{TAB2}lineage=expand(\n"
+            f'{TAB3}str(report_dir / "lineage_assignment" / "{{sample}}.lineage.csv"), sample=samples\n'  # noqa: E501  due to readability of test
+            f"{TAB2}),\n"
+            f"{TAB2}subsample_logs=list(subsample_logfiles),"
         )
         line_length = 88
-        formatter = setup_formatter(snakecode, line_length)
-        actual = formatter.get_formatted()
+        actual = format_snakefile(snakecode, line_length)
         expected = (
             f"rule coverage_report:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}lineage=expand(\n"
-            f'{TAB * 3}str(report_dir / "lineage_assignment" / "{{sample}}.lineage.csv"),\n'  # noqa: E501  due to readability of test
-            f"{TAB * 3}sample=samples,\n"
-            f"{TAB * 2}),\n"
-            f"{TAB * 2}subsample_logs=list(subsample_logfiles),\n"
+            f"{TAB}input:\n"
+            f"{TAB2}lineage=expand(\n"
+            f'{TAB3}str(report_dir / "lineage_assignment" / "{{sample}}.lineage.csv"),\n'  # noqa: E501  due to readability of test
+            f"{TAB3}sample=samples,\n"
+            f"{TAB2}),\n"
+            f"{TAB2}subsample_logs=list(subsample_logfiles),\n"
         )
 
         assert actual == expected
@@ -1283,78 +1190,71 @@ class TestLineWrapping:
         """issue 111"""
         snakecode = (
             f"rule r:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}expand(\n"
-            f'{TAB * 3}os.path.join("dir1"),\n'
-            f"{TAB * 2})+\n"
-            f"{TAB * 2}[\n"
-            f'{TAB * 2}"dirname",\n'
-            f"{TAB * 2}],\n"
+            f"{TAB}input:\n"
+            f"{TAB2}expand(\n"
+            f'{TAB3}os.path.join("dir1"),\n'
+            f"{TAB2})+\n"
+            f"{TAB2}[\n"
+            f'{TAB2}"dirname",\n'
+            f"{TAB2}],\n"
         )
         expected = (
             f"rule r:\n"
-            f"{TAB * 1}input:\n"
-            f"{TAB * 2}expand(\n"
-            f'{TAB * 3}os.path.join("dir1"),\n'
-            f"{TAB * 2})\n"
-            f"{TAB * 2}+ [\n"
-            f'{TAB * 3}"dirname",\n'
-            f"{TAB * 2}],\n"
+            f"{TAB}input:\n"
+            f"{TAB2}expand(\n"
+            f'{TAB3}os.path.join("dir1"),\n'
+            f"{TAB2})\n"
+            f"{TAB2}+ [\n"
+            f'{TAB3}"dirname",\n'
+            f"{TAB2}],\n"
         )
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == expected
+        assert format_snakefile(snakecode) == expected
 
     def test_indenting_long_param_lines(self):
         """https://github.com/snakemake/snakefmt/issues/124"""
         snakecode = (
             "rule a:\n"
-            f"{TAB*1}output:\n"
-            f'{TAB*2}"foo",\n'
-            f"{TAB*1}params:\n"
-            f"{TAB*2}datasources=(\n"
-            f'{TAB*3}"-s {{}}".format(" ".join(config["annotations"]["dgidb"]["datasources"]))\n'  # noqa: E501
-            f'{TAB*3}if config["annotations"]["dgidb"].get("datasources", "")\n'
-            f'{TAB*3}else ""\n'
-            f"{TAB*2}),\n"
+            f"{TAB}output:\n"
+            f'{TAB2}"foo",\n'
+            f"{TAB}params:\n"
+            f"{TAB2}datasources=(\n"
+            f'{TAB3}"-s {{}}".format(" ".join(config["annotations"]["dgidb"]["datasources"]))\n'  # noqa: E501
+            f'{TAB3}if config["annotations"]["dgidb"].get("datasources", "")\n'
+            f'{TAB3}else ""\n'
+            f"{TAB2}),\n"
         )
-        formatter = setup_formatter(snakecode)
-
-        assert formatter.get_formatted() == snakecode
+        assert format_snakefile(snakecode) == snakecode
 
     def test_indented_block_with_functions_and_rule(self):
         """https://github.com/snakemake/snakefmt/issues/124#issuecomment-986845398"""
         snakecode = (
             "if True:\n\n"
-            f"{TAB*1}def func1():\n"
-            f'''{TAB*2}"""docstring"""\n'''
-            f"{TAB*2}pass\n\n"
-            f"{TAB*1}rule foo:\n"
-            f"{TAB*2}shell:\n"
-            f'{TAB*3}"echo bar"\n\n'
-            f"{TAB*1}def func2():\n"
-            f'''{TAB*2}"""this function should stay indented"""\n'''
-            f"{TAB*2}pass\n"
-        )
-        formatter = setup_formatter(snakecode)
-
-        assert formatter.get_formatted() == snakecode
+            f"{TAB}def func1():\n"
+            f'''{TAB2}"""docstring"""\n'''
+            f"{TAB2}pass\n\n"
+            f"{TAB}rule foo:\n"
+            f"{TAB2}shell:\n"
+            f'{TAB3}"echo bar"\n\n'
+            f"{TAB}def func2():\n"
+            f'''{TAB2}"""this function should stay indented"""\n'''
+            f"{TAB2}pass\n"
+        )
+        assert format_snakefile(snakecode) == snakecode
 
     def test_wrap_line_in_run_directive(self):
         """https://github.com/snakemake/snakefmt/issues/171"""
         snakecode = (
             "rule a:\n"
-            f"{TAB * 1}run:\n"
-            f"{TAB * 2}if x:\n"
-            f"{TAB * 3}for x in xs:\n"
-            f"{TAB * 4}if True:\n"
-            f'{TAB * 5}record_type, name, sequence, *__ = line.strip("\\n").split(\n'
-            f'{TAB * 6}"\\t", maxsplit=3\n'
-            f"{TAB * 5})\n"
-            f"{TAB * 5}new_line = (\n"
-            f'{TAB * 6}"\\t".join([record_type, name, "*", f"LN:i:{{len(sequence)}}"])\n'  # noqa: E501
-            f'{TAB * 6}+ "\\n"\n'
-            f"{TAB * 5})\n"
-        )
-
-        formatter = setup_formatter(snakecode)
-        assert formatter.get_formatted() == snakecode
+            f"{TAB}run:\n"
+            f"{TAB2}if x:\n"
+            f"{TAB3}for x in xs:\n"
+            f"{TAB4}if True:\n"
+            f'{TAB5}record_type, name, sequence, *__ = line.strip("\\n").split(\n'
+            f'{TAB6}"\\t", maxsplit=3\n'
+            f"{TAB5})\n"
+            f"{TAB5}new_line = (\n"
+            f'{TAB6}"\\t".join([record_type, name, "*", f"LN:i:{{len(sequence)}}"])\n'  # noqa: E501
+            f'{TAB6}+ "\\n"\n'
+            f"{TAB5})\n"
+        )
+        assert format_snakefile(snakecode) == snakecode